@@ -2,45 +2,81 @@
 Advanced usage examples for PDF to DOCX converter.
 """
 
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 from pdf_to_docx import PDFToDOCXConverter, ConversionConfig
 from pdf_to_docx.utils import validate_pdf, get_file_info, format_file_size
 
 
-def batch_conversion():
-    """Convert multiple PDF files."""
+def _convert_one(pdf_file: str) -> Path:
+    """Convert a single, already validated PDF file (runs in a worker process)."""
+    pdf_path = Path(pdf_file)
+    
+    # Read the file info here in the worker and hand it to the converter, so
+    # it neither validates the PDF again nor re-reads it for logging
+    info = get_file_info(pdf_path)
+    converter = PDFToDOCXConverter(
+        pdf_path=pdf_path,
+        docx_path=pdf_path.with_suffix('.docx'),
+        prevalidated_info=info
+    )
+    return converter.convert()
+
+
+async def _validate_and_convert(
+    pdf_file: str,
+    executor: ProcessPoolExecutor,
+    validator: ThreadPoolExecutor,
+    semaphore: asyncio.Semaphore
+) -> Optional[Path]:
+    """Validate a PDF in the validator thread, then convert it in the executor."""
+    loop = asyncio.get_running_loop()
+    
+    # Existence and header checks are I/O bound; running them in a thread
+    # overlaps them with the conversions already in progress
+    is_valid, error = await loop.run_in_executor(validator, validate_pdf, Path(pdf_file))
+    if not is_valid:
+        print(f"Skipping {pdf_file}: {error}")
+        return None
+    
+    async with semaphore:
+        try:
+            result = await loop.run_in_executor(executor, _convert_one, pdf_file)
+        except Exception as e:
+            print(f"✗ Failed to convert {pdf_file}: {e}")
+            return None
+    
+    print(f"✓ Converted: {pdf_file} -> {result}")
+    return result
+
+
+async def batch_conversion():
+    """Convert multiple PDF files concurrently, one worker per CPU core."""
     pdf_files = [
         "document1.pdf",
         "document2.pdf",
         "document3.pdf",
     ]
     
-    results = []
-    for pdf_file in pdf_files:
-        pdf_path = Path(pdf_file)
-        if not pdf_path.exists():
-            print(f"Skipping {pdf_file}: file not found")
-            continue
-        
-        # Validate PDF
-        is_valid, error = validate_pdf(pdf_path)
-        if not is_valid:
-            print(f"Skipping {pdf_file}: {error}")
-            continue
-        
-        # Convert
-        try:
-            converter = PDFToDOCXConverter(
-                pdf_path=pdf_path,
-                docx_path=pdf_path.with_suffix('.docx')
-            )
-            result = converter.convert()
-            results.append(result)
-            print(f"✓ Converted: {pdf_file} -> {result}")
-        except Exception as e:
-            print(f"✗ Failed to convert {pdf_file}: {e}")
+    # Each PDF is independent, so files are converted in separate processes
+    # (pdf2docx parsing is CPU-bound and holds the GIL). The converters keep
+    # the default single-process config, so workers do not start page pools.
+    max_workers = os.cpu_count() or 1
+    
+    # validate_pdf may fall back to PyMuPDF, which is not thread-safe, so all
+    # validation runs on a single thread
+    semaphore = asyncio.Semaphore(max_workers)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor, \
+            ThreadPoolExecutor(max_workers=1) as validator:
+        results = await asyncio.gather(
+            *[_validate_and_convert(pdf_file, executor, validator, semaphore) for pdf_file in pdf_files]
+        )
     
-    print(f"\nBatch conversion complete: {len(results)}/{len(pdf_files)} files converted")
+    converted = [result for result in results if result]
+    print(f"\nBatch conversion complete: {len(converted)}/{len(pdf_files)} files converted")
 
 
 def conversion_with_validation():
@@ -50,12 +86,12 @@ def conversion_with_validation():
     # Get file information
     info = get_file_info(pdf_path)
     print(f"PDF Information:")
-    print(f"  Name: {info['name']}")
-    print(f"  Size: {format_file_size(info['size'])}")
-    print(f"  Pages: {info['pages']}")
-    print(f"  Encrypted: {info['encrypted']}")
+    print(f"  Name: {info.name}")
+    print(f"  Size: {format_file_size(info.size)}")
+    print(f"  Pages: {info.pages}")
+    print(f"  Encrypted: {info.encrypted}")
     
-    if info['encrypted']:
+    if info.encrypted:
         print("  ⚠ Warning: PDF is encrypted")
         return
     
@@ -94,7 +130,7 @@ def convert_specific_pages():
     """Convert specific page range."""
     pdf_path = Path("input.pdf")
     
-    # Convert pages 5-10 (0-based indexing)
+    # Convert pages 5-9 (0-based indexing, end page is exclusive)
     config = ConversionConfig(
         start_page=5,
         end_page=10,
@@ -103,17 +139,17 @@ def convert_specific_pages():
     
     converter = PDFToDOCXConverter(
         pdf_path=pdf_path,
-        docx_path="output_pages_5-10.docx",
+        docx_path="output_pages_5-9.docx",
         config=config
     )
     
     result = converter.convert()
-    print(f"Converted pages 5-10 to: {result}")
+    print(f"Converted pages 5-9 to: {result}")
 
 
 if __name__ == "__main__":
     # Uncomment the example you want to run
-    # batch_conversion()
+    # asyncio.run(batch_conversion())
     # conversion_with_validation()
     # convert_specific_pages()
     pass
@@ -21,7 +21,7 @@ def custom_conversion():
     """Conversion with custom configuration."""
     config = ConversionConfig(
         start_page=0,
-        end_page=10,  # Convert first 11 pages
+        end_page=10,  # Convert first 10 pages (end page is exclusive)
         overwrite=True,
         create_backup=True,
         verbose=True
@@ -4,18 +4,26 @@ A professional Python package for converting PDF files to DOCX format
 with excellent format preservation.
 """
 
-from .converter import PDFToDOCXConverter
 from .config import ConversionConfig, DEFAULT_CONFIG
-from .utils import validate_pdf, validate_output_path, get_file_info
+from .utils import PdfInfo, validate_pdf, validate_output_path, get_file_info
 
 __version__ = "1.0.0"
 __author__ = "Your Name"
 __all__ = [
     "PDFToDOCXConverter",
+    "ScannedPDFError",
     "ConversionConfig",
     "DEFAULT_CONFIG",
     "validate_pdf",
     "validate_output_path",
     "get_file_info",
+    "PdfInfo",
 ]
 
+
+def __getattr__(name):
+    """Import the converter module lazily on first access (PEP 562)."""
+    if name in ("PDFToDOCXConverter", "ScannedPDFError"):
+        from . import converter
+        return getattr(converter, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
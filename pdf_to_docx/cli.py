@@ -2,14 +2,16 @@
 Command-line interface for PDF to DOCX converter.
 """
 
+import os
+import stat
 import sys
 import argparse
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from .converter import PDFToDOCXConverter
 from .config import ConversionConfig
-from .utils import get_file_info, format_file_size
+from .utils import PdfInfo, get_file_info, format_file_size
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -52,7 +54,7 @@ Examples:
         "--end-page",
         type=int,
         default=None,
-        help="End page index (0-based, default: last page)"
+        help="End page index (0-based, exclusive, default: last page)"
     )
     
     # Output options
@@ -68,6 +70,25 @@ Examples:
         help="Create backup of existing output file"
     )
     
+    parser.add_argument(
+        "--skip-scanned",
+        action="store_true",
+        help="Skip scanned (image-only) PDFs instead of converting them"
+    )
+    
+    # Cache options
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the conversion cache"
+    )
+    
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Ignore cached conversions and convert again (refreshes the cache)"
+    )
+    
     # Logging options
     parser.add_argument(
         "--verbose",
@@ -100,21 +121,24 @@ Examples:
         "--cpu-count",
         type=int,
         default=None,
-        help="Number of CPU cores to use for multi-processing"
+        help="Number of CPU cores to use for multi-processing (default: all but one)"
     )
     
     return parser
 
 
-def print_file_info(pdf_path: Path):
-    """Print information about the PDF file."""
-    info = get_file_info(pdf_path)
+# Built once at import; parse_args does not modify the parser, so it is reused
+_PARSER = create_parser()
+
+
+def print_file_info(info: PdfInfo):
+    """Print PDF file information as returned by ``get_file_info``."""
     print(f"\nPDF Information:")
-    print(f"  File: {info['name']}")
-    print(f"  Size: {format_file_size(info['size'])}")
-    print(f"  Pages: {info['pages']}")
-    print(f"  Encrypted: {info['encrypted']}")
-    if info['encrypted']:
+    print(f"  File: {info.name}")
+    print(f"  Size: {format_file_size(info.size)}")
+    print(f"  Pages: {info.pages}")
+    print(f"  Encrypted: {info.encrypted}")
+    if info.encrypted:
         print(f"  ⚠ Warning: PDF is encrypted")
     print()
 
@@ -129,28 +153,43 @@ def main(args: Optional[list] = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for error)
     """
-    parser = create_parser()
-    parsed_args = parser.parse_args(args)
+    parsed_args = _PARSER.parse_args(args)
     
     # Handle quiet flag
     verbose = parsed_args.verbose and not parsed_args.quiet
     
     try:
-        # Validate input file
+        # Validate input file with a single stat call
         pdf_path = Path(parsed_args.pdf_path)
-        if not pdf_path.exists():
+        try:
+            pdf_stat = os.stat(pdf_path)
+        except FileNotFoundError:
             print(f"Error: PDF file not found: {pdf_path}", file=sys.stderr)
             return 1
         
+        if not stat.S_ISREG(pdf_stat.st_mode):
+            print(f"Error: Path is not a file: {pdf_path}", file=sys.stderr)
+            return 1
+        
+        if pdf_path.suffix.lower() != ".pdf":
+            print(f"Error: File is not a PDF: {pdf_path}", file=sys.stderr)
+            return 1
+        
         # Set output path
         if parsed_args.output:
             docx_path = Path(parsed_args.output)
         else:
             docx_path = pdf_path.with_suffix('.docx')
         
-        # Print file info
+        # Read file info once; the converter reuses it instead of re-validating
+        info = get_file_info(pdf_path, pdf_stat)
         if verbose:
-            print_file_info(pdf_path)
+            print_file_info(info)
+        
+        # Leave one core free for the parent process when multi-processing
+        cpu_count = parsed_args.cpu_count
+        if parsed_args.multi_processing and cpu_count is None:
+            cpu_count = max(1, (os.cpu_count() or 1) - 1)
         
         # Create configuration
         config = ConversionConfig(
@@ -158,17 +197,21 @@ def main(args: Optional[list] = None) -> int:
             end_page=parsed_args.end_page,
             overwrite=parsed_args.overwrite,
             create_backup=parsed_args.backup,
+            skip_scanned=parsed_args.skip_scanned,
+            use_cache=not parsed_args.no_cache,
+            force_refresh=parsed_args.force_refresh,
             verbose=verbose,
             log_file=Path(parsed_args.log_file) if parsed_args.log_file else None,
             multi_processing=parsed_args.multi_processing,
-            cpu_count=parsed_args.cpu_count,
+            cpu_count=cpu_count,
         )
         
         # Create converter and convert
         converter = PDFToDOCXConverter(
             pdf_path=pdf_path,
             docx_path=docx_path,
-            config=config
+            config=config,
+            prevalidated_info=info
         )
         
         result_path = converter.convert()
@@ -193,6 +236,29 @@ def main(args: Optional[list] = None) -> int:
         return 1
 
 
+def main_batch(args_list: List[list]) -> List[int]:
+    """
+    Run the command-line interface once per argument list.
+    
+    Useful for scripts converting many files in one process, as the parser
+    and the imported conversion libraries are reused across runs.
+    
+    Args:
+        args_list: List of command-line argument lists
+        
+    Returns:
+        Exit code for each argument list
+    """
+    exit_codes = []
+    for args in args_list:
+        try:
+            exit_codes.append(main(args))
+        except SystemExit as e:
+            # argparse exits on usage errors and --help
+            exit_codes.append(e.code if isinstance(e.code, int) else 1)
+    return exit_codes
+
+
 if __name__ == "__main__":
     sys.exit(main())
 
@@ -2,14 +2,33 @@
 Configuration module for PDF to DOCX conversion.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, List
+import os
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Mapping, Optional, List
 from pathlib import Path
 
 
-@dataclass
+# Default table detection settings, shared read-only by all configurations
+_DEFAULT_TABLE_SETTINGS = {
+    "min_border_vertical": 0.5,
+    "min_border_horizontal": 0.5,
+    "intersection_threshold": 0.25,
+    "min_words_vertical": 3,
+    "min_words_horizontal": 1,
+}
+
+
+@dataclass(frozen=True)
 class ConversionConfig:
-    """Configuration for PDF to DOCX conversion."""
+    """
+    Configuration for PDF to DOCX conversion.
+    
+    Instances are immutable, so a single configuration can be shared between
+    converters; use ``dataclasses.replace`` to derive a modified copy.
+    ``table_settings`` is stored as a read-only mapping proxy, which
+    ``dataclasses.asdict`` cannot copy; use ``to_dict`` instead.
+    """
     
     # Page range
     start_page: int = 0
@@ -28,19 +47,38 @@ class ConversionConfig:
     overwrite: bool = False
     create_backup: bool = False
     
+    # Raise ScannedPDFError instead of converting image-only (scanned) PDFs
+    skip_scanned: bool = False
+    
+    # Conversion cache
+    use_cache: bool = True
+    force_refresh: bool = False
+    
     # Advanced options
-    table_settings: dict = field(default_factory=lambda: {
-        "min_border_vertical": 0.5,
-        "min_border_horizontal": 0.5,
-        "intersection_threshold": 0.25,
-        "min_words_vertical": 3,
-        "min_words_horizontal": 1,
-    })
+    table_settings: Mapping = field(
+        default_factory=lambda: MappingProxyType(_DEFAULT_TABLE_SETTINGS),
+        hash=False,
+    )
     
     # Logging
     verbose: bool = True
     log_file: Optional[Path] = None
     
+    def __post_init__(self):
+        # Freeze caller-supplied table settings as well
+        if not isinstance(self.table_settings, MappingProxyType):
+            object.__setattr__(self, "table_settings", MappingProxyType(dict(self.table_settings)))
+    
+    def __getstate__(self) -> dict:
+        # Mapping proxies cannot be pickled; send a plain dict to worker processes
+        state = dict(self.__dict__)
+        state["table_settings"] = dict(self.table_settings)
+        return state
+    
+    def __setstate__(self, state: dict):
+        state["table_settings"] = MappingProxyType(state["table_settings"])
+        self.__dict__.update(state)
+    
     def validate(self) -> List[str]:
         """
         Validate configuration and return list of errors.
@@ -59,23 +97,36 @@ class ConversionConfig:
         if self.cpu_count is not None and self.cpu_count < 1:
             errors.append("cpu_count must be >= 1")
         
+        available_cpus = os.cpu_count()
+        if self.cpu_count is not None and available_cpus and self.cpu_count > available_cpus:
+            errors.append(f"cpu_count must be <= {available_cpus} (available CPU cores)")
+        
         return errors
     
     def to_dict(self) -> dict:
         """Convert configuration to dictionary."""
+        result = {f.name: getattr(self, f.name) for f in fields(self)}
+        result["table_settings"] = dict(self.table_settings)
+        result["log_file"] = str(self.log_file) if self.log_file else None
+        return result
+    
+    def output_settings(self) -> dict:
+        """
+        Return the settings that affect the generated DOCX content.
+        
+        Used to key the conversion cache, so options like logging or
+        overwrite behaviour do not invalidate cached results.
+        
+        Returns:
+            Dictionary of output-affecting settings
+        """
         return {
             "start_page": self.start_page,
             "end_page": self.end_page,
-            "multi_processing": self.multi_processing,
-            "cpu_count": self.cpu_count,
             "preserve_layout": self.preserve_layout,
             "preserve_images": self.preserve_images,
             "preserve_tables": self.preserve_tables,
-            "overwrite": self.overwrite,
-            "create_backup": self.create_backup,
-            "table_settings": self.table_settings,
-            "verbose": self.verbose,
-            "log_file": str(self.log_file) if self.log_file else None,
+            "table_settings": dict(self.table_settings),
         }
 
 
@@ -2,21 +2,77 @@
 Main converter module for PDF to DOCX conversion.
 """
 
+import functools
 import logging
+import os
+import tempfile
 from pathlib import Path
-from typing import Optional, Callable
-from pdf2docx import Converter as PDF2DOCXConverter
+from typing import Optional, Callable, List, Tuple, TYPE_CHECKING
 
 from .config import ConversionConfig, DEFAULT_CONFIG
 from .utils import (
     validate_pdf,
     validate_output_path,
     get_file_info,
+    PdfInfo,
+    classify_pdf,
     format_file_size,
+    open_pdf,
+    close_pdf,
     create_backup,
+    copy_file,
+    prefetch_file,
     setup_logging,
+    compute_cache_key,
+    CACHE_DIR,
 )
 
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF
+    from pdf2docx import Converter as PDF2DOCXConverter
+
+
+class ScannedPDFError(RuntimeError):
+    """Raised when a scanned (image-only) PDF is skipped instead of converted."""
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pdf2docx_converter() -> type:
+    """
+    Import pdf2docx and build a Converter subclass that reports page progress.
+    
+    pdf2docx is heavy, so it is only imported on first use. The subclass is
+    built once and reused; every conversion still creates its own instance.
+    
+    Returns:
+        pdf2docx Converter subclass accepting a ``progress_callback``
+    """
+    from pdf2docx import Converter as PDF2DOCXConverter
+    
+    class ProgressConverter(PDF2DOCXConverter):
+        """pdf2docx Converter that calls back after each parsed page."""
+        
+        def __init__(self, pdf_file: str, progress_callback: Optional[Callable[[int, int], None]] = None):
+            super().__init__(pdf_file)
+            self.progress_callback = progress_callback
+        
+        def parse_pages(self, **kwargs):
+            if self.progress_callback:
+                pages = [page for page in self._pages if not page.skip_parsing]
+                for index, page in enumerate(pages, start=1):
+                    page.parse = self._report_after(page.parse, index, len(pages))
+            return super().parse_pages(**kwargs)
+        
+        def _report_after(self, parse: Callable, index: int, total: int) -> Callable:
+            def parse_and_report(**kwargs):
+                try:
+                    return parse(**kwargs)
+                finally:
+                    self.progress_callback(index, total)
+            return parse_and_report
+    
+    return ProgressConverter
+
 
 class PDFToDOCXConverter:
     """
@@ -30,7 +86,8 @@ class PDFToDOCXConverter:
         self,
         pdf_path: Path,
         docx_path: Optional[Path] = None,
-        config: Optional[ConversionConfig] = None
+        config: Optional[ConversionConfig] = None,
+        prevalidated_info: Optional[PdfInfo] = None
     ):
         """
         Initialize the converter.
@@ -39,14 +96,25 @@ class PDFToDOCXConverter:
             pdf_path: Path to the input PDF file
             docx_path: Path to the output DOCX file (optional, auto-generated if not provided)
             config: Conversion configuration (optional, uses default if not provided)
+            prevalidated_info: File information from ``get_file_info`` for a PDF the
+                caller has already checked (optional, skips re-validation)
         """
         self.pdf_path = Path(pdf_path)
         self.config = config or DEFAULT_CONFIG
         
-        # Validate PDF
-        is_valid, error = validate_pdf(self.pdf_path)
-        if not is_valid:
-            raise ValueError(f"Invalid PDF file: {error}")
+        # File information, read at most once and shared by logging and progress
+        self._doc_info: Optional[PdfInfo] = prevalidated_info
+        
+        # PyMuPDF document shared by the file info and scan checks (opened on demand)
+        self._document: Optional["fitz.Document"] = None
+        
+        if prevalidated_info is None:
+            # Validate PDF (header/trailer check only; pdf2docx reports parse errors)
+            is_valid, error = validate_pdf(self.pdf_path, deep=False)
+            if not is_valid:
+                raise ValueError(f"Invalid PDF file: {error}")
+        elif not prevalidated_info.pages:
+            raise ValueError(f"Invalid PDF file: no readable pages in {self.pdf_path}")
         
         # Set output path
         if docx_path:
@@ -66,10 +134,13 @@ class PDFToDOCXConverter:
         )
         
         # Converter instance (created during convert)
-        self.converter: Optional[PDF2DOCXConverter] = None
+        self.converter: Optional["PDF2DOCXConverter"] = None
         
         # Progress callback
         self.progress_callback: Optional[Callable[[int, int], None]] = None
+        
+        # Highest page count reported by pdf2docx during the last conversion
+        self._pages_reported = 0
     
     def set_progress_callback(self, callback: Callable[[int, int], None]):
         """
@@ -80,15 +151,42 @@ class PDFToDOCXConverter:
         """
         self.progress_callback = callback
     
+    def _report_page(self, current: int, total: int):
+        """Forward per-page progress from pdf2docx, remembering how far it got."""
+        self._pages_reported = max(self._pages_reported, current)
+        self.progress_callback(current, total)
+    
+    def _get_document(self) -> Optional["fitz.Document"]:
+        """Return the converter's PyMuPDF document, opening it on first use."""
+        if self._document is None:
+            try:
+                self._document = open_pdf(self.pdf_path)
+            except Exception:
+                # The helpers retry the open themselves and report the error
+                return None
+        return self._document
+    
+    def _close_document(self):
+        """Close the converter's PyMuPDF document, if open."""
+        if self._document is not None:
+            close_pdf(self._document)
+            self._document = None
+    
+    def _get_doc_info(self) -> PdfInfo:
+        """Return information about the PDF file, reading it on first use."""
+        if self._doc_info is None:
+            self._doc_info = get_file_info(self.pdf_path, doc=self._get_document())
+        return self._doc_info
+    
     def _log_file_info(self):
         """Log information about the PDF file."""
-        info = get_file_info(self.pdf_path)
-        self.logger.info(f"PDF File: {info['name']}")
-        self.logger.info(f"Size: {format_file_size(info['size'])}")
-        self.logger.info(f"Pages: {info['pages']}")
-        self.logger.info(f"Encrypted: {info['encrypted']}")
+        info = self._get_doc_info()
+        self.logger.info(f"PDF File: {info.name}")
+        self.logger.info(f"Size: {format_file_size(info.size)}")
+        self.logger.info(f"Pages: {info.pages}")
+        self.logger.info(f"Encrypted: {info.encrypted}")
         
-        if info['encrypted']:
+        if info.encrypted:
             self.logger.warning("PDF is encrypted. Conversion may fail if password is required.")
     
     def _create_backup_if_needed(self):
@@ -100,6 +198,38 @@ class PDFToDOCXConverter:
             else:
                 self.logger.warning("Failed to create backup")
     
+    def _get_cache_path(self) -> Optional[Path]:
+        """Return the cache location for this PDF and configuration, if caching is enabled."""
+        if not self.config.use_cache:
+            return None
+        
+        try:
+            key = compute_cache_key(self.pdf_path, self.config.output_settings())
+        except OSError as e:
+            self.logger.warning(f"Conversion cache disabled: {e}")
+            return None
+        
+        return CACHE_DIR / f"{key}.docx"
+    
+    def _store_in_cache(self, cache_path: Path):
+        """Copy the converted DOCX file into the conversion cache."""
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique per call, so concurrent conversions never share a temp file
+            fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=cache_path.parent)
+            os.close(fd)
+            tmp_path = Path(tmp_name)
+            copy_file(self.docx_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Failed to store conversion in cache: {e}")
+            if tmp_path is not None:
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+    
     def convert(self) -> Path:
         """
         Convert PDF to DOCX with format preservation.
@@ -109,6 +239,7 @@ class PDFToDOCXConverter:
             
         Raises:
             ValueError: If configuration is invalid
+            ScannedPDFError: If the PDF is image-only and skip_scanned is enabled
             RuntimeError: If conversion fails
         """
         # Validate configuration
@@ -116,8 +247,16 @@ class PDFToDOCXConverter:
         if config_errors:
             raise ValueError(f"Invalid configuration: {', '.join(config_errors)}")
         
-        # Log file information
-        self._log_file_info()
+        try:
+            # Log file information
+            self._log_file_info()
+            
+            # Layout analysis yields nothing useful for image-only pages
+            if self.config.skip_scanned and classify_pdf(self.pdf_path, doc=self._get_document()) == "scanned":
+                raise ScannedPDFError(f"PDF appears to be scanned (no extractable text): {self.pdf_path}")
+        finally:
+            # pdf2docx opens the PDF itself, so do not keep this copy open
+            self._close_document()
         
         # Create backup if needed
         self._create_backup_if_needed()
@@ -126,25 +265,46 @@ class PDFToDOCXConverter:
         self.logger.info("This may take a moment depending on PDF complexity...")
         
         try:
-            # Initialize converter
-            self.converter = PDF2DOCXConverter(str(self.pdf_path))
+            # Reuse a previous conversion of the same PDF content and settings
+            cache_path = self._get_cache_path()
+            if cache_path and cache_path.exists() and not self.config.force_refresh:
+                copy_file(cache_path, self.docx_path)
+                self.logger.info(f"Using cached conversion: {cache_path}")
+                self.logger.info(f"Output file: {self.docx_path}")
+                return self.docx_path
+            
+            # Start pulling the PDF into the page cache before pdf2docx reads it
+            prefetch_file(self.pdf_path)
+            
+            # Initialize converter; pages report progress as they are parsed
+            self.converter = _load_pdf2docx_converter()(
+                str(self.pdf_path),
+                progress_callback=self._report_page if self.progress_callback else None
+            )
             
             # Get page range
             start = self.config.start_page
             end = self.config.end_page
             
             # Convert PDF to DOCX
-            # pdf2docx handles all the complex layout preservation
+            # pdf2docx handles all the complex layout preservation and,
+            # with multi_processing enabled, parses pages across a worker pool
+            # (per-page progress is then only reported on completion)
             self.converter.convert(
                 str(self.docx_path),
                 start=start,
-                end=end
+                end=end,
+                multi_processing=self.config.multi_processing,
+                cpu_count=self.config.cpu_count or os.cpu_count()
             )
             
             # Verify output file was created
             if not self.docx_path.exists():
                 raise RuntimeError("Conversion completed but output file was not created")
             
+            if cache_path:
+                self._store_in_cache(cache_path)
+            
             output_size = self.docx_path.stat().st_size
             self.logger.info(f"Conversion complete!")
             self.logger.info(f"Output file: {self.docx_path}")
@@ -165,33 +325,72 @@ class PDFToDOCXConverter:
         """
         Convert PDF to DOCX with progress tracking.
         
+        The progress callback is called with (0, total) before conversion and
+        after each page is parsed. A final (total, total) is sent only when
+        the per-page reports did not already reach the total, e.g. when the
+        result came from the cache.
+        
         Returns:
             Path to the created DOCX file
         """
         # Get total pages for progress tracking
-        info = get_file_info(self.pdf_path)
-        total_pages = info['pages']
+        total_pages = self._get_doc_info().pages
         
-        # Adjust for page range
+        # Same range as pdf2docx: end page is exclusive, None/0 means last page
         start = self.config.start_page
         end = self.config.end_page or total_pages
-        pages_to_convert = end - start + 1
+        pages_to_convert = len(range(total_pages)[start:end])
         
         if self.progress_callback:
             self.progress_callback(0, pages_to_convert)
         
+        self._pages_reported = 0
         try:
             result = self.convert()
             
-            if self.progress_callback:
+            if self.progress_callback and self._pages_reported < pages_to_convert:
                 self.progress_callback(pages_to_convert, pages_to_convert)
             
             return result
         except Exception as e:
+            # convert() may fail before it closes the document opened above
+            self._close_document()
             if self.progress_callback:
                 self.progress_callback(0, pages_to_convert)  # Reset on error
             raise
     
+    @classmethod
+    def convert_many(
+        cls,
+        pairs: List[Tuple[Path, Optional[Path]]],
+        config: Optional[ConversionConfig] = None
+    ) -> List[Path]:
+        """
+        Convert several PDF files with a shared configuration.
+        
+        pdf2docx is imported before any file is touched, so a missing or broken
+        install fails immediately. Files are converted in order and the batch
+        stops at the first error.
+        
+        Args:
+            pairs: List of (pdf_path, docx_path) tuples; docx_path may be None
+            config: Conversion configuration shared by all files (optional)
+            
+        Returns:
+            Paths to the created DOCX files, in input order
+            
+        Raises:
+            ValueError: If a PDF or output path is invalid
+            RuntimeError: If a conversion fails
+        """
+        _load_pdf2docx_converter()
+        
+        results = []
+        for pdf_path, docx_path in pairs:
+            with cls(pdf_path, docx_path, config=config) as converter:
+                results.append(converter.convert())
+        return results
+    
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -201,5 +400,6 @@ class PDFToDOCXConverter:
         if self.converter:
             self.converter.close()
             self.converter = None
+        self._close_document()
         return False
 
@@ -2,18 +2,126 @@
 Utility functions for PDF to DOCX conversion.
 """
 
+import hashlib
+import json
 import logging
+import mmap
+import os
+import shutil
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
-import fitz  # PyMuPDF
+from typing import Optional, Tuple, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF
 
-def validate_pdf(pdf_path: Path) -> Tuple[bool, Optional[str]]:
+
+# Directory holding previously converted DOCX files, keyed by content hash
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "pdf_to_docx"
+
+# Pages with fewer extracted characters than this are treated as scanned images
+SCANNED_TEXT_THRESHOLD = 32
+
+# Logging handlers built by setup_logging for the current (verbose, log_file)
+_HANDLER_CACHE: dict = {}
+
+# Units used by format_file_size, in steps of 1024
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Files above this size are memory-mapped instead of read through file handles
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+
+@dataclass
+class PdfInfo:
+    """Information about a PDF file, as returned by ``get_file_info``."""
+    
+    __slots__ = ("path", "name", "size", "pages", "encrypted", "metadata")
+    
+    path: str
+    name: str
+    size: int
+    pages: int
+    encrypted: bool
+    metadata: dict
+
+
+def open_pdf(pdf_path: Path, stat_result: Optional[os.stat_result] = None) -> "fitz.Document":
+    """
+    Open a PDF with PyMuPDF, memory-mapping large files.
+    
+    Mapping lets the OS page the file in on demand instead of copying it into
+    the process heap. Close the document with ``close_pdf`` so the mapping is
+    released together with it.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        stat_result: Result of ``os.stat`` on the file, if already known
+        
+    Returns:
+        Opened PyMuPDF document
+    """
+    # Imported here so that the CLI and package import stay fast
+    import fitz  # PyMuPDF
+    
+    size = (stat_result or pdf_path.stat()).st_size
+    if size <= MMAP_THRESHOLD:
+        return fitz.open(str(pdf_path))
+    
+    fd = os.open(str(pdf_path), os.O_RDONLY)
+    try:
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    
+    # Pages are walked front to back during conversion
+    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    
+    view = memoryview(mm)
+    try:
+        doc = fitz.open(stream=view, filetype="pdf")
+    except Exception as e:
+        # Unmap right away instead of waiting for garbage collection
+        view.release()
+        mm.close()
+        if isinstance(e, TypeError):
+            # Older PyMuPDF releases only accept bytes-like streams
+            return fitz.open(str(pdf_path))
+        raise
+    
+    doc._pdf_mmap = mm
+    doc._pdf_view = view
+    return doc
+
+
+def close_pdf(doc: "fitz.Document"):
+    """
+    Close a document returned by ``open_pdf``, unmapping its file if needed.
+    
+    Args:
+        doc: PyMuPDF document to close
+    """
+    doc.close()
+    mm = getattr(doc, "_pdf_mmap", None)
+    if mm is not None:
+        doc._pdf_view.release()
+        mm.close()
+
+
+def validate_pdf(pdf_path: Path, deep: bool = False) -> Tuple[bool, Optional[str]]:
     """
     Validate that a file is a valid PDF.
     
+    By default only the header and trailer markers are checked, which costs
+    two small reads regardless of file size. Structural problems are then
+    reported by the conversion itself. Files without an ``%%EOF`` marker near
+    the end get the full PyMuPDF check, as readers still accept many of them.
+    
     Args:
         pdf_path: Path to the PDF file
+        deep: Also open the document with PyMuPDF and check it has pages
         
     Returns:
         Tuple of (is_valid, error_message)
@@ -27,11 +135,29 @@ def validate_pdf(pdf_path: Path) -> Tuple[bool, Optional[str]]:
     if pdf_path.suffix.lower() != ".pdf":
         return False, f"File is not a PDF: {pdf_path}"
     
+    # Check the "%PDF-" header (readers tolerate leading junk such as a BOM)
+    # and the "%%EOF" marker near the end of the file
+    try:
+        with open(pdf_path, "rb") as f:
+            if b"%PDF-" not in f.read(1024):
+                return False, "Invalid PDF file: missing %PDF- header"
+            
+            size = f.seek(0, 2)
+            f.seek(max(0, size - 1024))
+            has_eof_marker = b"%%EOF" in f.read()
+    except OSError as e:
+        return False, f"Cannot read PDF file: {str(e)}"
+    
+    if not deep and has_eof_marker:
+        return True, None
+    
     # Try to open with PyMuPDF to verify it's a valid PDF
     try:
-        doc = fitz.open(str(pdf_path))
-        page_count = len(doc)
-        doc.close()
+        doc = open_pdf(pdf_path)
+        try:
+            page_count = len(doc)
+        finally:
+            close_pdf(doc)
         
         if page_count == 0:
             return False, "PDF has no pages"
@@ -72,37 +198,100 @@ def validate_output_path(docx_path: Path, overwrite: bool = False) -> Tuple[bool
     return True, None
 
 
-def get_file_info(pdf_path: Path) -> dict:
+def get_file_info(
+    pdf_path: Path,
+    stat_result: Optional[os.stat_result] = None,
+    doc: Optional["fitz.Document"] = None
+) -> PdfInfo:
     """
     Get information about a PDF file.
     
     Args:
         pdf_path: Path to the PDF file
+        stat_result: Result of ``os.stat`` on the file, if the caller already has it
+        doc: Already opened PyMuPDF document for the file (optional, skips opening it)
         
     Returns:
-        Dictionary with file information
+        PdfInfo with file information
     """
-    info = {
-        "path": str(pdf_path),
-        "name": pdf_path.name,
-        "size": pdf_path.stat().st_size if pdf_path.exists() else 0,
-        "pages": 0,
-        "encrypted": False,
-        "metadata": {},
-    }
+    if stat_result is None and pdf_path.exists():
+        stat_result = pdf_path.stat()
+    
+    info = PdfInfo(
+        path=str(pdf_path),
+        name=pdf_path.name,
+        size=stat_result.st_size if stat_result else 0,
+        pages=0,
+        encrypted=False,
+        metadata={},
+    )
     
     try:
-        doc = fitz.open(str(pdf_path))
-        info["pages"] = len(doc)
-        info["encrypted"] = doc.is_encrypted
-        info["metadata"] = doc.metadata
-        doc.close()
+        opened = open_pdf(pdf_path, stat_result) if doc is None else None
+        try:
+            source = opened or doc
+            info.pages = len(source)
+            info.encrypted = source.is_encrypted
+            info.metadata = source.metadata
+        finally:
+            if opened is not None:
+                close_pdf(opened)
     except Exception as e:
         logging.warning(f"Could not read PDF info: {e}")
     
     return info
 
 
+def classify_pdf(
+    pdf_path: Path,
+    sample_pages: int = 5,
+    doc: Optional["fitz.Document"] = None
+) -> str:
+    """
+    Classify a PDF by how much extractable text it contains.
+    
+    Samples up to ``sample_pages`` evenly spaced pages, so the cost does not
+    grow with document length.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        sample_pages: Maximum number of pages to sample
+        doc: Already opened PyMuPDF document for the file (optional, skips opening it)
+        
+    Returns:
+        "scanned" if the sampled pages carry almost no text, "mixed" if only
+        some of them do, otherwise "text"
+    """
+    try:
+        opened = open_pdf(pdf_path) if doc is None else None
+        try:
+            doc = opened or doc
+            page_count = len(doc)
+            if page_count == 0:
+                # Nothing to sample; leave the error to the conversion itself
+                return "text"
+            
+            count = min(sample_pages, page_count)
+            if count == 1:
+                indexes = [0]
+            else:
+                indexes = [round(i * (page_count - 1) / (count - 1)) for i in range(count)]
+            
+            lengths = [len(doc[i].get_text("text").strip()) for i in indexes]
+        finally:
+            if opened is not None:
+                close_pdf(opened)
+    except Exception as e:
+        logging.warning(f"Could not classify PDF: {e}")
+        return "text"
+    
+    if sum(lengths) / len(lengths) < SCANNED_TEXT_THRESHOLD:
+        return "scanned"
+    if any(length < SCANNED_TEXT_THRESHOLD for length in lengths):
+        return "mixed"
+    return "text"
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -113,11 +302,136 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    if size_bytes <= 0:
+        return f"{size_bytes:.2f} B"
+    
+    # Each unit is 2**10 times the previous one, so the bit length picks the unit
+    unit_index = max(0, min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1))
+    return f"{size_bytes / (1 << (unit_index * 10)):.2f} {SIZE_UNITS[unit_index]}"
+
+
+def fast_file_hash(file_path: Path) -> str:
+    """
+    Compute the BLAKE2b digest of a file.
+    
+    Uses ``hashlib.file_digest`` on Python 3.11+ and hashes a memory map of
+    the file otherwise; both hash in C without a Python-level read loop.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Hex digest of the file content
+    """
+    with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "blake2b").hexdigest()
+        
+        digest = hashlib.blake2b()
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest.update(mm)
+        return digest.hexdigest()
+
+
+def _converter_versions() -> dict:
+    """Return the versions of the code that produces DOCX output."""
+    from . import __version__
+    
+    try:
+        from importlib.metadata import version
+    except ImportError:
+        # Python 3.7 needs the importlib-metadata backport
+        try:
+            from importlib_metadata import version
+        except ImportError:
+            version = None
+    
+    try:
+        pdf2docx_version = version("pdf2docx") if version else "unknown"
+    except Exception:
+        pdf2docx_version = "unknown"
+    
+    return {"pdf_to_docx": __version__, "pdf2docx": pdf2docx_version}
+
+
+def compute_cache_key(pdf_path: Path, settings: dict) -> str:
+    """
+    Compute the conversion cache key for a PDF file.
+    
+    The key also covers the versions of this package and pdf2docx, so
+    upgrading either one does not serve DOCX files produced by the old code.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        settings: Output-affecting conversion settings
+        
+    Returns:
+        Hex digest identifying the PDF content, settings and converter versions
+    """
+    digest = hashlib.blake2b(fast_file_hash(pdf_path).encode("ascii"))
+    keyed = {"settings": settings, "versions": _converter_versions()}
+    digest.update(json.dumps(keyed, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def copy_file(src: Path, dst: Path):
+    """
+    Copy a file together with its metadata (like ``shutil.copy2``).
+    
+    On Linux the data is copied with ``copy_file_range``, which can share
+    extents on filesystems that support reflinks (e.g. Btrfs, XFS). Elsewhere
+    this gains little: ``shutil.copy2`` already copies in the kernel with
+    ``sendfile`` on Linux, and it is used whenever ``copy_file_range`` fails
+    or stops short.
+    
+    Args:
+        src: Path to the source file
+        dst: Path to the destination file
+    """
+    if sys.platform.startswith("linux") and hasattr(os, "copy_file_range"):
+        try:
+            remaining = src.stat().st_size
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+            # Some filesystems report 0 for copies they do not support
+        except OSError:
+            # e.g. cross-device copies on older kernels; use the portable path
+            pass
+    
+    shutil.copy2(src, dst)
+
+
+def prefetch_file(file_path: Path):
+    """
+    Ask the OS to start reading a file into the page cache.
+    
+    Uses ``posix_fadvise(POSIX_FADV_WILLNEED)``, whose read-ahead outlives the
+    short-lived descriptor opened here. Does nothing on platforms without
+    ``posix_fadvise`` (e.g. Windows and macOS).
+    
+    Args:
+        file_path: Path to the file about to be read
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    
+    try:
+        fd = os.open(str(file_path), os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logging.debug(f"Read-ahead hint failed for {file_path}: {e}")
 
 
 def create_backup(file_path: Path) -> Optional[Path]:
@@ -142,30 +456,16 @@ def create_backup(file_path: Path) -> Optional[Path]:
         counter += 1
     
     try:
-        import shutil
-        shutil.copy2(file_path, backup_path)
+        copy_file(file_path, backup_path)
         return backup_path
     except Exception as e:
         logging.error(f"Failed to create backup: {e}")
         return None
 
 
-def setup_logging(verbose: bool = True, log_file: Optional[Path] = None) -> logging.Logger:
-    """
-    Setup logging configuration.
-    
-    Args:
-        verbose: Whether to enable verbose logging
-        log_file: Optional path to log file
-        
-    Returns:
-        Configured logger
-    """
-    logger = logging.getLogger("pdf_to_docx")
-    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
-    
-    # Remove existing handlers
-    logger.handlers.clear()
+def _create_log_handlers(verbose: bool, log_file: Optional[Path]) -> list:
+    """Create the console and (optional) file handlers for ``setup_logging``."""
+    handlers = []
     
     # Console handler
     console_handler = logging.StreamHandler()
@@ -175,18 +475,55 @@ def setup_logging(verbose: bool = True, log_file: Optional[Path] = None) -> logg
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
-    # File handler (if specified)
+    # File handler (if specified); the file is only opened on the first record
     if log_file:
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
         file_handler.setLevel(logging.DEBUG)
         file_format = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
-    return logger
+    return handlers
 
+
+def setup_logging(verbose: bool = True, log_file: Optional[Path] = None) -> logging.Logger:
+    """
+    Setup logging configuration.
+    
+    Handlers are reused while the (verbose, log_file) combination stays the
+    same, so creating many converters does not rebuild them or reopen log
+    files. Switching to another combination closes the previous handlers, so
+    at most one log file is held open.
+    
+    Args:
+        verbose: Whether to enable verbose logging
+        log_file: Optional path to log file
+        
+    Returns:
+        Configured logger
+    """
+    logger = logging.getLogger("pdf_to_docx")
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    
+    key = (verbose, str(log_file) if log_file else None)
+    handlers = _HANDLER_CACHE.get(key)
+    if handlers is None:
+        for old_handlers in _HANDLER_CACHE.values():
+            for handler in old_handlers:
+                logger.removeHandler(handler)
+                handler.close()
+        _HANDLER_CACHE.clear()
+        handlers = _HANDLER_CACHE[key] = _create_log_handlers(verbose, log_file)
+    
+    # Swap in the handlers for this configuration if others are installed
+    if logger.handlers != handlers:
+        logger.handlers.clear()
+        for handler in handlers:
+            logger.addHandler(handler)
+    
+    return logger